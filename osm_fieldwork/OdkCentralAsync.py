@@ -19,14 +19,99 @@
 
 import logging
 import os
-from asyncio import gather
+import ssl
+from asyncio import Lock, Semaphore, as_completed, create_task, gather, get_running_loop, shield
+from time import monotonic
 from typing import Optional
 from uuid import uuid4
 
 import aiohttp
+import ijson
+import orjson
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
 
 log = logging.getLogger(__name__)
 
+# Connection defaults, read from the environment once at import rather
+# than on every instance construction
+_DEFAULT_URL = os.getenv("ODK_CENTRAL_URL", default=None)
+_DEFAULT_USER = os.getenv("ODK_CENTRAL_USER", default=None)
+_DEFAULT_PASSWD = os.getenv("ODK_CENTRAL_PASSWD", default=None)
+_DEFAULT_VERIFY = os.getenv("ODK_CENTRAL_SECURE", default="true").lower() in ("true", "1", "t")
+
+# A single connection pool shared by all client instances, so that repeated
+# 'async with' blocks reuse warm keep-alive connections to the Central host.
+# The session is bound to one event loop and rebuilt if the loop changes.
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP = None
+_SESSION_REFCOUNT: int = 0
+
+# Bearer tokens cached by (url, user), so new client instances skip the
+# /sessions round-trip while a token is still valid. Central tokens last
+# 24h; refresh slightly early to avoid racing expiry.
+_TOKEN_CACHE: dict = {}
+_TOKEN_LOCKS: dict = {}
+_TOKEN_TTL = 23 * 3600
+
+
+def _uuid4_batch(count: int) -> list:
+    """Generate random version 4 UUID strings from one urandom read.
+
+    Equivalent to [str(uuid4()) for _ in range(count)], but pulls all the
+    randomness in a single syscall and applies the RFC 4122 version and
+    variant bits directly, avoiding per-UUID object construction.
+
+    Args:
+        count (int): The number of UUIDs to generate.
+
+    Returns:
+        list: UUID strings in canonical dashed form.
+    """
+    buf = bytearray(os.urandom(16 * count))
+    uuids = []
+    for index in range(0, len(buf), 16):
+        buf[index + 6] = (buf[index + 6] & 0x0F) | 0x40
+        buf[index + 8] = (buf[index + 8] & 0x3F) | 0x80
+        hexed = buf[index : index + 16].hex()
+        uuids.append(f"{hexed[:8]}-{hexed[8:12]}-{hexed[12:16]}-{hexed[16:20]}-{hexed[20:]}")
+    return uuids
+
+
+async def _json(response: aiohttp.ClientResponse):
+    """Decode a response body with orjson, bypassing aiohttp's stdlib codec.
+
+    Args:
+        response (aiohttp.ClientResponse): The response to decode.
+
+    Returns:
+        The parsed JSON content.
+    """
+    return orjson.loads(await response.read())
+
+
+# Bodies at least this large are decoded off the event loop
+_OFFLOAD_THRESHOLD = 1_000_000
+
+
+async def _json_offloaded(response: aiohttp.ClientResponse):
+    """Decode a response body with orjson, off the event loop when large.
+
+    Small bodies parse inline to dodge thread-pool dispatch overhead; a
+    large body parses in a worker thread, so other in-flight requests
+    keep making progress during the decode.
+
+    Args:
+        response (aiohttp.ClientResponse): The response to decode.
+
+    Returns:
+        The parsed JSON content.
+    """
+    body = await response.read()
+    if len(body) < _OFFLOAD_THRESHOLD:
+        return orjson.loads(body)
+    return await get_running_loop().run_in_executor(None, orjson.loads, body)
+
 
 class OdkCentral(object):
     def __init__(
@@ -46,24 +131,24 @@ class OdkCentral(object):
         Returns:
             (OdkCentral): An instance of this class
         """
-        if not url:
-            url = os.getenv("ODK_CENTRAL_URL", default=None)
-        self.url = url
-        if not user:
-            user = os.getenv("ODK_CENTRAL_USER", default=None)
-        self.user = user
-        if not passwd:
-            passwd = os.getenv("ODK_CENTRAL_PASSWD", default=None)
-        self.passwd = passwd
-        verify = os.getenv("ODK_CENTRAL_SECURE", default=True)
-        if type(verify) == str:
-            self.verify = verify.lower() in ("true", "1", "t")
-        else:
-            self.verify = verify
+        self.url = url or _DEFAULT_URL
+        self.user = user or _DEFAULT_USER
+        self.passwd = passwd or _DEFAULT_PASSWD
+        self.verify = _DEFAULT_VERIFY
 
         # Base URL for the REST API
         self.version = "v1"
         self.base = f"{self.url}/{self.version}/"
+        # Pre-parsed URL, so per-request paths are joined rather than
+        # re-formatted and re-parsed from strings
+        self._base_url = URL(self.base)
+
+        # Per-instance auth headers, passed on each request so multiple
+        # credentials can share the one session pool. Immutable multidicts
+        # that aiohttp reuses without copying per call.
+        self._auth_header = CIMultiDictProxy(CIMultiDict())
+        self._auth_ext_header = CIMultiDictProxy(CIMultiDict())
+        self._token_expiry: float = 0.0
 
     def __enter__(self):
         """Sync context manager not allowed."""
@@ -75,24 +160,129 @@ class OdkCentral(object):
 
     async def __aenter__(self):
         """Async object instantiation."""
+        global _SHARED_SESSION, _SESSION_LOOP, _SESSION_REFCOUNT
         # Header enables persistent connection, creates a cookie for this session
-        self.session = aiohttp.ClientSession(
-            raise_for_status=True,
-            headers={"accept": "odkcentral"},
-        )
-        await self.authenticate()
+        # NOTE aiohttp speaks HTTP/1.1 only, so concurrency comes from the
+        # keep-alive pool below rather than HTTP/2 stream multiplexing
+        if _SHARED_SESSION is None or _SHARED_SESSION.closed or _SESSION_LOOP is not get_running_loop():
+            # One SSLContext for the whole pool, rather than aiohttp
+            # resolving the ssl argument per request. The first instance
+            # to open the pool decides certificate verification.
+            ssl_context = ssl.create_default_context() if self.verify else False
+            _SHARED_SESSION = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ssl=ssl_context,
+                    limit=100,
+                    limit_per_host=32,
+                    use_dns_cache=True,
+                    ttl_dns_cache=600,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                ),
+                headers={"accept": "odkcentral"},
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=60),
+            )
+            _SESSION_LOOP = get_running_loop()
+            _SESSION_REFCOUNT = 0
+        _SESSION_REFCOUNT += 1
+        self.session = _SHARED_SESSION
+        # Resolve the host concurrently with authentication, so a cached
+        # token doesn't leave the first real request paying cold DNS
+        warm_task = create_task(self._warmConnector())
+        try:
+            await self.authenticate()
+        except BaseException:
+            # A failed entry never reaches __aexit__, so release the
+            # refcount here or the shared session leaks open forever
+            warm_task.cancel()
+            _SESSION_REFCOUNT -= 1
+            if _SESSION_REFCOUNT <= 0 and not self.session.closed:
+                await self.session.close()
+            raise
+        await warm_task
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
-        """Async object close."""
-        if self.session:
+        """Async object close, releasing the shared session when unused."""
+        global _SESSION_REFCOUNT
+        _SESSION_REFCOUNT -= 1
+        if _SESSION_REFCOUNT <= 0 and self.session and not self.session.closed:
             await self.session.close()
 
     async def authenticate(self):
-        """Authenticate to an ODK Central server."""
-        async with self.session.post(f"{self.base}sessions", json={"email": self.user, "password": self.passwd}) as response:
-            token = (await response.json())["token"]
-            self.session.headers.update({"Authorization": f"Bearer {token}"})
+        """Authenticate to an ODK Central server.
+
+        A valid cached token for the same server and user is reused, and
+        concurrent authentication attempts are coalesced into one POST.
+        """
+        cache_key = (self.url, self.user)
+        lock = _TOKEN_LOCKS.setdefault(cache_key, Lock())
+        async with lock:
+            cached = _TOKEN_CACHE.get(cache_key)
+            if cached and cached[1] - monotonic() > 60:
+                self._setAuthHeaders(cached[0])
+                self._token_expiry = cached[1]
+                return
+            url = self._base_url / "sessions"
+            async with self.session.post(url, json={"email": self.user, "password": self.passwd}) as response:
+                response.raise_for_status()
+                token = (await _json(response))["token"]
+            self._token_expiry = monotonic() + _TOKEN_TTL
+            _TOKEN_CACHE[cache_key] = (token, self._token_expiry)
+            self._setAuthHeaders(token)
+
+    def _setAuthHeaders(self, token: str):
+        """Precompute the reusable per-request header multidicts.
+
+        aiohttp converts a plain dict to a CIMultiDict on every request;
+        building the two variants once per token makes that allocation-free.
+
+        Args:
+            token (str): The bearer token for the session.
+        """
+        bearer = f"Bearer {token}"
+        self._auth_header = CIMultiDictProxy(CIMultiDict({"Authorization": bearer}))
+        self._auth_ext_header = CIMultiDictProxy(CIMultiDict({"Authorization": bearer, "X-Extended-Metadata": "true"}))
+
+    async def _ensure_auth(self):
+        """Refresh the bearer token before it expires.
+
+        A cheap clock comparison on each request entry, so a long-lived
+        client re-authenticates proactively instead of hitting a 401 and
+        retrying after its token times out.
+        """
+        if monotonic() > self._token_expiry - 60:
+            await self.authenticate()
+
+    async def _warmConnector(self):
+        """Pre-resolve the Central host to warm the connector's DNS cache.
+
+        Best effort only; resolution failures surface on the first real
+        request instead.
+        """
+        host = self._base_url.host
+        if not host:
+            return
+        try:
+            await self.session.connector._resolve_host(host, self._base_url.port)
+        except Exception as e:
+            log.debug(f"DNS warm-up failed for {host}: {e}")
+
+    async def _iter_value(self, response: aiohttp.ClientResponse):
+        """Incrementally parse the 'value' array of an OData response.
+
+        Rows are yielded as they arrive on the wire, so the full response
+        body is never buffered in memory.
+
+        Args:
+            response (aiohttp.ClientResponse): An in-flight OData response.
+
+        Yields:
+            dict: The next row of the 'value' array.
+        """
+        async for row in ijson.items_async(response.content, "value.item"):
+            yield row
 
 
 class OdkProject(OdkCentral):
@@ -123,13 +313,15 @@ class OdkProject(OdkCentral):
         Returns:
             (list): The list of XForms in this project
         """
-        url = f"{self.base}projects/{projectId}/forms"
-        headers = {}
-        if metadata:
-            headers.update({"X-Extended-Metadata": "true"})
+        await self._ensure_auth()
+        url = self._base_url / "projects" / str(projectId) / "forms"
+        headers = self._auth_ext_header if metadata else self._auth_header
         try:
-            async with self.session.get(url, ssl=self.verify, headers=headers) as response:
-                self.forms = await response.json()
+            async with self.session.get(url, headers=headers) as response:
+                if response.status >= 400:
+                    log.error(f"Error fetching forms ({response.status}): {await response.text()}")
+                    return []
+                self.forms = await _json(response)
                 return self.forms
         except aiohttp.ClientError as e:
             log.error(f"Error fetching forms: {e}")
@@ -153,10 +345,14 @@ class OdkProject(OdkCentral):
         Returns:
             (json): The JSON of Submissions.
         """
-        url = f"{self.base}projects/{projectId}/forms/{xform}.svc/Submissions"
+        await self._ensure_auth()
+        url = self._base_url / "projects" / str(projectId) / "forms" / f"{xform}.svc" / "Submissions"
         try:
-            async with self.session.get(url, params=filters, ssl=self.verify) as response:
-                return await response.json()
+            async with self.session.get(url, params=filters, headers=self._auth_header) as response:
+                if response.status >= 400:
+                    log.error(f"Error fetching submissions ({response.status}): {await response.text()}")
+                    return {}
+                return await _json_offloaded(response)
         except aiohttp.ClientError as e:
             log.error(f"Error fetching submissions: {e}")
             return {}
@@ -172,24 +368,114 @@ class OdkProject(OdkCentral):
             (json): All of the submissions for all of the XForm in a project
         """
         log.info(f"Getting all submissions for ODK project ({projectId}) forms ({xforms})")
+        await self._ensure_auth()
         submission_data = []
 
-        submission_tasks = [self.listSubmissions(projectId, task, filters) for task in xforms]
-        submissions = await gather(*submission_tasks, return_exceptions=True)
+        # Cap concurrent requests so hundreds of forms don't exhaust the pool
+        semaphore = Semaphore(16)
+
+        async def fetch_submissions(xform):
+            async with semaphore:
+                async for submission in self._streamSubmissions(projectId, xform, filters):
+                    submission_data.append(submission)
 
-        for submission in submissions:
-            if isinstance(submission, Exception):
-                log.error(f"Failed to get submissions: {submission}")
-                continue
-            log.debug(f"There are {len(submission['value'])} submissions")
-            submission_data.extend(submission["value"])
+        for task in as_completed([fetch_submissions(task) for task in xforms]):
+            try:
+                await task
+            except Exception as e:
+                log.error(f"Failed to get submissions: {e}")
 
+        log.info("Fetched %d submissions across %d forms", len(submission_data), len(xforms))
         return submission_data
 
+    async def _streamSubmissions(self, projectId: int, xform: str, filters: dict = None):
+        """Stream the submissions for a form, without buffering the response.
+
+        Args:
+            projectId (int): The ID of the project on ODK Central
+            xform (str): The XForm to get the details of from ODK Central
+
+        Yields:
+            dict: The next submission instance.
+        """
+        url = self._base_url / "projects" / str(projectId) / "forms" / f"{xform}.svc" / "Submissions"
+        async with self.session.get(url, params=filters, headers=self._auth_header) as response:
+            response.raise_for_status()
+            async for submission in self._iter_value(response):
+                yield submission
+
+
+class _BoundDataset(object):
+    """A dataset-scoped view of an OdkEntity client.
+
+    Precomputes the Entity creation URL and request arguments for one
+    (project, dataset) pair, so hot loops creating many Entities avoid
+    re-deriving them on every call.
+    """
+
+    def __init__(self, client, projectId: int, datasetName: str):
+        """Args:
+            client (OdkEntity): The client to bind to.
+            projectId (int): The ID of the project on ODK Central.
+            datasetName (str): The name of a dataset, specific to a project.
+
+        Returns:
+            (_BoundDataset): An instance of this object.
+        """
+        self._client = client
+        self._url = client._base_url / "projects" / str(projectId) / "datasets" / datasetName / "entities"
+
+    async def create(self, label: str, data: dict, entityUuid: Optional[str] = None) -> dict:
+        """Create a new Entity in the bound dataset.
+
+        Args:
+            label (str): Label for the Entity.
+            data (dict): Key:Value pairs to insert as Entity data.
+            entityUuid (str): Pre-generated UUID for the Entity, else one
+                is generated.
+
+        Returns:
+            dict: JSON of entity details.
+                The 'uuid' field includes the unique entity identifier.
+        """
+        # The CSV must contain a geometry field to work
+        # TODO also add this validation to uploadMedia if CSV format
+        if "geometry" not in data:
+            msg = "'geometry' data field is mandatory"
+            log.debug(msg)
+            raise ValueError(msg)
+
+        client = self._client
+        await client._ensure_auth()
+        try:
+            # The session and auth header are read per call, since the
+            # shared pool or token may have been refreshed since binding
+            async with client.session.post(
+                self._url,
+                headers=client._auth_header,
+                json={
+                    "uuid": entityUuid or str(uuid4()),
+                    "label": label,
+                    "data": data,
+                },
+            ) as response:
+                if response.status >= 400:
+                    log.error(f"Failed to create Entity ({response.status}): {await response.text()}")
+                    return {}
+                return await _json(response)
+        except aiohttp.ClientError as e:
+            log.error(f"Failed to create Entity: {e}")
+            return {}
+
 
 class OdkEntity(OdkCentral):
     """Class to manipulate a Entity on an ODK Central server."""
 
+    # Maximum Entities per bulk creation request, to stay under payload limits
+    _entity_batch_size = 500
+    # Batches above this stream their request body rather than buffering it
+    _entity_stream_threshold = 100
+
     def __init__(
         self,
         url: Optional[str] = None,
@@ -228,10 +514,14 @@ class OdkEntity(OdkCentral):
         Returns:
             list: a list of JSON dataset metadata.
         """
-        url = f"{self.base}projects/{projectId}/datasets/"
+        await self._ensure_auth()
+        url = self._base_url / "projects" / str(projectId) / "datasets"
         try:
-            async with self.session.get(url, ssl=self.verify) as response:
-                return await response.json()
+            async with self.session.get(url, headers=self._auth_header) as response:
+                if response.status >= 400:
+                    log.error(f"Error fetching datasets ({response.status}): {await response.text()}")
+                    return []
+                return await _json(response)
         except aiohttp.ClientError as e:
             log.error(f"Error fetching datasets: {e}")
             return []
@@ -271,20 +561,37 @@ class OdkEntity(OdkCentral):
         Returns:
             list: a list of JSON entity metadata, for a dataset.
         """
-        url = f"{self.base}projects/{projectId}/datasets/{datasetName}/entities"
+        await self._ensure_auth()
+        url = self._base_url / "projects" / str(projectId) / "datasets" / datasetName / "entities"
         try:
-            async with self.session.get(url, ssl=self.verify) as response:
-                return await response.json()
+            async with self.session.get(url, headers=self._auth_header) as response:
+                if response.status >= 400:
+                    log.error(f"Error fetching entities ({response.status}): {await response.text()}")
+                    return []
+                return await _json_offloaded(response)
         except aiohttp.ClientError as e:
             log.error(f"Error fetching entities: {e}")
             return []
 
+    def bindDataset(self, projectId: int, datasetName: str) -> _BoundDataset:
+        """Bind this client to one project dataset for repeated operations.
+
+        Args:
+            projectId (int): The ID of the project on ODK Central.
+            datasetName (str): The name of a dataset, specific to a project.
+
+        Returns:
+            (_BoundDataset): A view with the request parameters precomputed.
+        """
+        return _BoundDataset(self, projectId, datasetName)
+
     async def createEntity(
         self,
         projectId: int,
         datasetName: str,
         label: str,
         data: dict,
+        entityUuid: Optional[str] = None,
     ) -> dict:
         """Create a new Entity in a project dataset (entity list).
 
@@ -303,68 +610,159 @@ class OdkEntity(OdkCentral):
             datasetName (int): The name of a dataset, specific to a project.
             label (str): Label for the Entity.
             data (dict): Key:Value pairs to insert as Entity data.
+            entityUuid (str): Pre-generated UUID for the Entity, else one
+                is generated.
 
         Returns:
             dict: JSON of entity details.
                 The 'uuid' field includes the unique entity identifier.
         """
-        # The CSV must contain a geometry field to work
-        # TODO also add this validation to uploadMedia if CSV format
-
-        required_fields = ["geometry"]
-        if not all(key in data for key in required_fields):
-            msg = "'geometry' data field is mandatory"
-            log.debug(msg)
-            raise ValueError(msg)
-
-        url = f"{self.base}projects/{projectId}/datasets/{datasetName}/entities"
-        try:
-            async with self.session.post(
-                url,
-                ssl=self.verify,
-                json={
-                    "uuid": str(uuid4()),
-                    "label": label,
-                    "data": data,
-                },
-            ) as response:
-                return await response.json()
-        except aiohttp.ClientError as e:
-            log.error(f"Failed to create Entity: {e}")
-            return {}
+        return await _BoundDataset(self, projectId, datasetName).create(label, data, entityUuid)
 
     async def createEntities(
         self,
         projectId: int,
         datasetName: str,
         labelDataDict: dict,
+        bulk: bool = True,
     ) -> list:
         """Bulk create Entities in a project dataset (entity list).
 
-        NOTE this endpoint will be redundant after Central 2024.01 release.
+        By default a single request is made to the bulk entity creation
+        endpoint available since ODK Central 2024.01. Very large uploads are
+        split into sub-batches to stay under server payload limits. Pass
+        bulk=False to fall back to one POST per Entity for older servers.
 
         Args:
             projectId (int): The ID of the project on ODK Central.
             datasetName (int): The name of a dataset, specific to a project.
             labelDataDict (dict): Mapping of Entity label:data (str:dict) to insert.
+            bulk (bool): Use the Central 2024.01 bulk creation endpoint.
 
         Returns:
             list: A list of Entity detail JSONs.
                 The 'uuid' field includes the unique entity identifier.
         """
         log.info(f"Bulk uploading Entities for project ({projectId}) dataset ({datasetName})")
+        await self._ensure_auth()
         entity_data = []
+        uuids = _uuid4_batch(len(labelDataDict))
+
+        # Each task handles its own failure, so no post-pass over results
+        # checking for returned exceptions is needed
+        if bulk:
+            # Columnar pre-pass: the per-Entity dicts are only assembled
+            # inside the single batch serialization, not per coroutine
+            labels = list(labelDataDict.keys())
+            datas = list(labelDataDict.values())
+            batch_size = self._entity_batch_size
+
+            async def upload_batch(start):
+                end = start + batch_size
+                try:
+                    entity_data.extend(
+                        await self._createEntityBatch(projectId, datasetName, uuids[start:end], labels[start:end], datas[start:end])
+                    )
+                except Exception as e:
+                    log.error(f"Failed to upload entity batch: {e}")
+
+            await gather(*[upload_batch(start) for start in range(0, len(labels), batch_size)])
+            if len(entity_data) != len(labels):
+                log.warning(f"Only {len(entity_data)} of {len(labels)} Entities were created")
+            return entity_data
+
+        dataset = self.bindDataset(projectId, datasetName)
+
+        async def upload_entity(entityUuid, label, data):
+            try:
+                entity_data.append(await dataset.create(label, data, entityUuid))
+            except Exception as e:
+                log.error(f"Failed to upload entity: {e}")
+
+        entity_tasks = [upload_entity(entityUuid, label, data) for entityUuid, (label, data) in zip(uuids, labelDataDict.items())]
+        await gather(*entity_tasks)
 
-        entity_tasks = [self.createEntity(projectId, datasetName, label, data) for label, data in labelDataDict.items()]
-        entities = await gather(*entity_tasks, return_exceptions=True)
+        return entity_data
 
-        for entity in entities:
-            if isinstance(entity, Exception):
-                log.error(f"Failed to upload entity: {entity}")
-                continue
-            entity_data.append(entity)
+    async def _createEntityBatch(
+        self,
+        projectId: int,
+        datasetName: str,
+        uuids: list,
+        labels: list,
+        datas: list,
+    ) -> list:
+        """Create a batch of Entities in a single POST to the bulk endpoint.
 
-        return entity_data
+        The payload is serialized in one orjson.dumps pass over the three
+        columns, amortizing encoding cost across all rows.
+
+        Args:
+            projectId (int): The ID of the project on ODK Central.
+            datasetName (int): The name of a dataset, specific to a project.
+            uuids (list): Pre-generated UUID strings, one per Entity.
+            labels (list): Labels, one per Entity.
+            datas (list): Key:Value data dicts, one per Entity.
+
+        Returns:
+            list: Entity detail dicts for the created batch. The bulk
+                endpoint only acknowledges success, so the details are
+                synthesized from the submitted rows.
+
+        Raises:
+            ValueError: The server did not acknowledge the batch.
+        """
+        url = self._base_url / "projects" / str(projectId) / "datasets" / datasetName / "entities"
+        headers = {**self._auth_header, "Content-Type": "application/json"}
+        if len(uuids) > self._entity_stream_threshold:
+            # Encode row by row while bytes are already on the wire;
+            # aiohttp sends async-iterable bodies chunked by itself
+            payload = self._streamEntityPayload(uuids, labels, datas)
+        else:
+            payload = orjson.dumps(
+                {
+                    "entities": [{"uuid": u, "label": lbl, "data": d} for u, lbl, d in zip(uuids, labels, datas)],
+                    "source": {"name": "osm-fieldwork"},
+                }
+            )
+
+        async def post_batch():
+            async with self.session.post(
+                url,
+                data=payload,
+                headers=headers,
+            ) as response:
+                response.raise_for_status()
+                response_msg = await _json(response)
+            if not response_msg.get("success", False):
+                raise ValueError(f"Server rejected entity batch: {response_msg}")
+            return [{"uuid": u, "label": lbl, "data": d} for u, lbl, d in zip(uuids, labels, datas)]
+
+        # Shielded so a cancelled caller can't sever a chunked upload
+        # mid-stream, leaving the server with a truncated request
+        return await shield(post_batch())
+
+    async def _streamEntityPayload(self, uuids: list, labels: list, datas: list):
+        """Yield a bulk Entity creation payload as encoded JSON chunks.
+
+        Serialization is interleaved with the network send, so the full
+        request body is never held in memory.
+
+        Args:
+            uuids (list): Pre-generated UUID strings, one per Entity.
+            labels (list): Labels, one per Entity.
+            datas (list): Key:Value data dicts, one per Entity.
+
+        Yields:
+            bytes: The next chunk of the JSON request body.
+        """
+        yield b'{"entities":['
+        first = True
+        for u, lbl, d in zip(uuids, labels, datas):
+            row = orjson.dumps({"uuid": u, "label": lbl, "data": d})
+            yield row if first else b"," + row
+            first = False
+        yield b'],"source":{"name":"osm-fieldwork"}}'
 
     async def updateEntity(
         self,
@@ -409,19 +807,23 @@ class OdkEntity(OdkCentral):
         if label:
             json_data["label"] = label
 
-        url = f"{self.base}projects/{projectId}/datasets/{datasetName}/entities/{entityUuid}"
+        await self._ensure_auth()
+        url = self._base_url / "projects" / str(projectId) / "datasets" / datasetName / "entities" / entityUuid
         if newVersion:
-            url = f"{url}?baseVersion={newVersion - 1}"
+            url = url.with_query({"baseVersion": newVersion - 1})
         else:
-            url = f"{url}?force=true"
+            url = url.with_query({"force": "true"})
 
         try:
             async with self.session.patch(
                 url,
-                ssl=self.verify,
+                headers=self._auth_header,
                 json=json_data,
             ) as response:
-                return await response.json()
+                if response.status >= 400:
+                    log.error(f"Failed to update Entity ({response.status}): {await response.text()}")
+                    return {}
+                return await _json(response)
         except aiohttp.ClientError as e:
             log.error(f"Failed to update Entity: {e}")
             return {}
@@ -444,11 +846,15 @@ class OdkEntity(OdkCentral):
         Returns:
             bool: Deletion successful or not.
         """
-        url = f"{self.base}projects/{projectId}/datasets/{datasetName}/entities/{entityUuid}"
+        await self._ensure_auth()
+        url = self._base_url / "projects" / str(projectId) / "datasets" / datasetName / "entities" / entityUuid
         log.debug(f"Deleting dataset ({datasetName}) entity UUID ({entityUuid})")
         try:
-            async with self.session.delete(url, ssl=self.verify) as response:
-                success = (response_msg := await response.json()).get("success", False)
+            async with self.session.delete(url, headers=self._auth_header) as response:
+                if response.status >= 400:
+                    log.error(f"Failed to delete Entity ({response.status}): {await response.text()}")
+                    return False
+                success = (response_msg := await _json(response)).get("success", False)
                 if not success:
                     log.debug(f"Server returned deletion unsuccessful: {response_msg}")
                 return success
@@ -493,10 +899,14 @@ class OdkEntity(OdkCentral):
         Returns:
             list: All entity data for a project dataset.
         """
-        url = f"{self.base}projects/{projectId}/datasets/{datasetName}.svc/Entities"
+        await self._ensure_auth()
+        url = self._base_url / "projects" / str(projectId) / "datasets" / f"{datasetName}.svc" / "Entities"
         try:
-            async with self.session.get(url, ssl=self.verify) as response:
-                return (await response.json()).get("value", {})
+            async with self.session.get(url, headers=self._auth_header) as response:
+                if response.status >= 400:
+                    log.error(f"Failed to get Entity data ({response.status}): {await response.text()}")
+                    return {}
+                return [entity async for entity in self._iter_value(response)]
         except aiohttp.ClientError as e:
             log.error(f"Failed to get Entity data: {e}")
             return {}
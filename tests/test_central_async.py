@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Humanitarian OpenStreetMap Team
+#
+# This file is part of osm_fieldwork.
+#
+#     osm-fieldwork is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     osm-fieldwork is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with osm_fieldwork.  If not, see <https:#www.gnu.org/licenses/>.
+#
+"""Test functionalty of OdkCentralAsync.py against a local aiohttp server."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from osm_fieldwork import OdkCentralAsync
+
+
+@pytest.fixture(autouse=True)
+def reset_session_state():
+    """Isolate the module-level session and token caches per test."""
+    OdkCentralAsync._SHARED_SESSION = None
+    OdkCentralAsync._SESSION_LOOP = None
+    OdkCentralAsync._SESSION_REFCOUNT = 0
+    OdkCentralAsync._TOKEN_CACHE.clear()
+    OdkCentralAsync._TOKEN_LOCKS.clear()
+    yield
+
+
+def _central_stub(received):
+    """Build a minimal ODK Central stand-in recording bulk entity POSTs."""
+
+    async def sessions(request):
+        return web.json_response({"token": "testtoken"})
+
+    async def entities(request):
+        received.append(
+            {
+                "transfer_encoding": request.headers.get("Transfer-Encoding"),
+                "body": await request.json(),
+            }
+        )
+        return web.json_response({"success": True})
+
+    app = web.Application()
+    app.router.add_post("/v1/sessions", sessions)
+    app.router.add_post("/v1/projects/1/datasets/test/entities", entities)
+    return app
+
+
+def test_create_entities_bulk():
+    """A small batch posts one buffered request to the bulk endpoint."""
+    received = []
+
+    async def run():
+        server = TestServer(_central_stub(received))
+        await server.start_server()
+        try:
+            async with OdkCentralAsync.OdkEntity(f"http://{server.host}:{server.port}", "test@hotosm.org", "testpass") as entity:
+                label_data = {f"point {index}": {"geometry": "0.0 0.0 0 0"} for index in range(50)}
+                return await entity.createEntities(1, "test", label_data)
+        finally:
+            await server.close()
+
+    entities = asyncio.run(run())
+
+    assert len(entities) == 50
+    assert len(received) == 1
+    assert len(received[0]["body"]["entities"]) == 50
+    assert entities[0]["uuid"] == received[0]["body"]["entities"][0]["uuid"]
+
+
+def test_create_entities_bulk_streamed():
+    """A batch over the streaming threshold uploads chunked and intact."""
+    received = []
+
+    async def run():
+        server = TestServer(_central_stub(received))
+        await server.start_server()
+        try:
+            async with OdkCentralAsync.OdkEntity(f"http://{server.host}:{server.port}", "test@hotosm.org", "testpass") as entity:
+                label_data = {f"point {index}": {"geometry": "0.0 0.0 0 0"} for index in range(150)}
+                return await entity.createEntities(1, "test", label_data)
+        finally:
+            await server.close()
+
+    entities = asyncio.run(run())
+
+    # The whole batch must reach the server, not be swallowed by a
+    # request-build error in the streaming path
+    assert len(entities) == 150
+    assert len(received) == 1
+    assert received[0]["transfer_encoding"] == "chunked"
+    assert [e["label"] for e in received[0]["body"]["entities"]] == [e["label"] for e in entities]